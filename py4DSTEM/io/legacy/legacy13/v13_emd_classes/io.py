@@ -32,7 +32,7 @@ def find_EMD_groups(group: h5py.Group, emd_group_type):
         group (HDF5 group):
         emd_group_type (int)
     """
-    keys = [k for k in group.keys() if "emd_group_type" in group[k].attrs.keys()]
+    keys = [k for k in group.keys() if "emd_group_type" in group[k].attrs]
     return [k for k in keys if group[k].attrs["emd_group_type"] == emd_group_type]
 
 
@@ -48,8 +48,8 @@ def EMD_group_exists(group: h5py.Group, emd_group_type, name: str):
     Returns:
         bool
     """
-    if name in group.keys():
-        if "emd_group_type" in group[name].attrs.keys():
+    if name in group:
+        if "emd_group_type" in group[name].attrs:
             if group[name].attrs["emd_group_type"] == emd_group_type:
                 return True
             return False
@@ -93,13 +93,12 @@ def Root_from_h5(group: h5py.Group):
         A Root instance
     """
     from py4DSTEM.io.legacy.legacy13.v13_emd_classes.root import Root
-    from os.path import basename
 
     er = f"Group {group} is not a valid EMD Metadata group"
-    assert "emd_group_type" in group.attrs.keys(), er
+    assert "emd_group_type" in group.attrs, er
     assert group.attrs["emd_group_type"] == EMD_group_types["Root"], er
 
-    root = Root(basename(group.name))
+    root = Root(group.name.rpartition("/")[2])
     return root
 
 
@@ -232,10 +231,9 @@ def Metadata_from_h5(group: h5py.Group):
         A Metadata instance
     """
     from py4DSTEM.io.legacy.legacy13.v13_emd_classes.metadata import Metadata
-    from os.path import basename
 
     er = f"Group {group} is not a valid EMD Metadata group"
-    assert "emd_group_type" in group.attrs.keys(), er
+    assert "emd_group_type" in group.attrs, er
     assert group.attrs["emd_group_type"] == EMD_group_types["Metadata"], er
 
     # Get data
@@ -331,7 +329,7 @@ def Metadata_from_h5(group: h5py.Group):
         data[k] = v
 
     # make Metadata instance, add data, and return
-    md = Metadata(basename(group.name))
+    md = Metadata(group.name.rpartition("/")[2])
     md._params.update(data)
     return md
 
@@ -413,10 +411,9 @@ def Array_from_h5(group: h5py.Group):
         An Array instance
     """
     from py4DSTEM.io.legacy.legacy13.v13_emd_classes.array import Array
-    from os.path import basename
 
     er = f"Group {group} is not a valid EMD Array group"
-    assert "emd_group_type" in group.attrs.keys(), er
+    assert "emd_group_type" in group.attrs, er
     assert group.attrs["emd_group_type"] == EMD_group_types["Array"], er
 
     # get data
@@ -454,7 +451,7 @@ def Array_from_h5(group: h5py.Group):
     # make Array
     ar = Array(
         data=data,
-        name=basename(group.name),
+        name=group.name.rpartition("/")[2],
         units=units,
         dims=dims,
         dim_names=dim_names,
@@ -514,10 +511,9 @@ def PointList_from_h5(group: h5py.Group):
         A PointList instance
     """
     from py4DSTEM.io.legacy.legacy13.v13_emd_classes.pointlist import PointList
-    from os.path import basename
 
     er = f"Group {group} is not a valid EMD PointList group"
-    assert "emd_group_type" in group.attrs.keys(), er
+    assert "emd_group_type" in group.attrs, er
     assert group.attrs["emd_group_type"] == EMD_group_types["PointList"], er
 
     # Get metadata
@@ -537,7 +533,7 @@ def PointList_from_h5(group: h5py.Group):
             data[field] = np.array(group[field])
 
     # Make the PointList
-    pl = PointList(data=data, name=basename(group.name))
+    pl = PointList(data=data, name=group.name.rpartition("/")[2])
 
     # Add additional metadata
     _read_metadata(pl, group)
@@ -568,9 +564,13 @@ def PointListArray_to_h5(pointlistarray, group):
     dtype = h5py.special_dtype(vlen=pointlistarray.dtype)
     dset = grp.create_dataset("data", pointlistarray.shape, dtype)
 
-    # Add data
-    for i, j in tqdmnd(dset.shape[0], dset.shape[1]):
-        dset[i, j] = pointlistarray[i, j].data
+    # Add data, gathering the PointLists first so they're written in a
+    # single call rather than one HDF5 write per scan position
+    data = np.empty(dset.shape, dtype=object)
+    for i in range(dset.shape[0]):
+        for j in range(dset.shape[1]):
+            data[i, j] = pointlistarray[i, j].data
+    dset[...] = data
 
     # Add additional metadata
     _write_metadata(pointlistarray, grp)
@@ -592,10 +592,9 @@ def PointListArray_from_h5(group: h5py.Group):
     from py4DSTEM.io.legacy.legacy13.v13_emd_classes.pointlistarray import (
         PointListArray,
     )
-    from os.path import basename
 
     er = f"Group {group} is not a valid EMD PointListArray group"
-    assert "emd_group_type" in group.attrs.keys(), er
+    assert "emd_group_type" in group.attrs, er
     assert group.attrs["emd_group_type"] == EMD_group_types["PointListArray"], er
 
     # Get the DataSet
@@ -604,7 +603,7 @@ def PointListArray_from_h5(group: h5py.Group):
     shape = dset.shape
 
     # Initialize a PointListArray
-    pla = PointListArray(dtype=dtype, shape=shape, name=basename(group.name))
+    pla = PointListArray(dtype=dtype, shape=shape, name=group.name.rpartition("/")[2])
 
     # Add data
     for i, j in tqdmnd(
@@ -625,18 +624,16 @@ def PointListArray_from_h5(group: h5py.Group):
 
 
 def _write_metadata(obj, grp):
-    items = obj._metadata.items()
-    if len(items) > 0:
+    if obj._metadata:
         grp_metadata = grp.create_group("_metadata")
-        for name, md in items:
-            obj._metadata[name].name = name
-            obj._metadata[name].to_h5(grp_metadata)
+        for md in obj._metadata.values():
+            md.to_h5(grp_metadata)
 
 
 def _read_metadata(obj, grp):
-    try:
-        grp_metadata = grp["_metadata"]
-        for key in grp_metadata.keys():
-            obj.metadata = Metadata_from_h5(grp_metadata[key])
-    except KeyError:
-        pass
+    if "_metadata" in grp:
+        # write straight into the metadata dict; Metadata_from_h5 always
+        # returns a Metadata instance, so the setter's type check is skipped
+        for md_grp in grp["_metadata"].values():
+            md = Metadata_from_h5(md_grp)
+            obj._metadata[md.name] = md
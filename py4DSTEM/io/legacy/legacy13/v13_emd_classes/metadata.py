@@ -51,8 +51,10 @@ class Metadata:
 
     def __repr__(self):
         space = " " * len(self.__class__.__name__) + "  "
-        string = f"{self.__class__.__name__}( A Metadata instance called '{self.name}', containing the following fields:"
-        string += "\n"
+        lines = [
+            f"{self.__class__.__name__}( A Metadata instance called '{self.name}', containing the following fields:",
+            "",
+        ]
 
         maxlen = 0
         for k in self._params.keys():
@@ -62,10 +64,10 @@ class Metadata:
         for k, v in self._params.items():
             if isinstance(v, np.ndarray):
                 v = f"{v.ndim}D-array"
-            string += "\n" + space + f"{k}:{(maxlen-len(k)+3)*' '}{str(v)}"
-        string += "\n)"
+            lines.append(space + f"{k}:{(maxlen-len(k)+3)*' '}{str(v)}")
+        lines.append(")")
 
-        return string
+        return "\n".join(lines)
 
     # HDF5 read/write
 
@@ -106,8 +106,7 @@ class PointList:
 
         pl = PointList(data=np.copy(self.data), name=name)
 
-        for k, v in self.metadata.items():
-            pl.metadata = v.copy(name=k)
+        pl._metadata.update({k: v.copy(name=k) for k, v in self._metadata.items()})
 
         return pl
 
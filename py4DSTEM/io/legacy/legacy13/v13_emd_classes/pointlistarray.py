@@ -86,8 +86,7 @@ class PointListArray:
                 pl = new_pla.get_pointlist(i, j)
                 pl.add(np.copy(self.get_pointlist(i, j).data))
 
-        for k, v in self.metadata.items():
-            new_pla.metadata = v.copy(name=k)
+        new_pla._metadata.update({k: v.copy(name=k) for k, v in self._metadata.items()})
 
         return new_pla
 
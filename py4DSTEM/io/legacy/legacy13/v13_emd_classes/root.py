@@ -33,12 +33,16 @@ class Root:
 
     def __repr__(self):
         space = " " * len(self.__class__.__name__) + "  "
-        string = f"{self.__class__.__name__}( A Root instance called '{self.name}', containing the following top-level object instances:"
-        string += "\n"
-        for k, v in self.tree._tree.items():
-            string += "\n" + space + f"    {k} \t\t ({v.__class__.__name__})"
-        string += "\n)"
-        return string
+        lines = [
+            f"{self.__class__.__name__}( A Root instance called '{self.name}', containing the following top-level object instances:",
+            "",
+        ]
+        lines.extend(
+            f"{space}    {k} \t\t ({v.__class__.__name__})"
+            for k, v in self.tree._tree.items()
+        )
+        lines.append(")")
+        return "\n".join(lines)
 
     # HDF5 read/write
 
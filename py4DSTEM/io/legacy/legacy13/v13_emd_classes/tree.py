@@ -3,6 +3,8 @@
 
 
 class Tree:
+    __slots__ = ("_tree",)
+
     def __init__(self):
         self._tree = {}
 
@@ -10,36 +12,31 @@ class Tree:
         self._tree[key] = value
 
     def __getitem__(self, x):
-        l = x.split("/")
-        try:
-            l.remove("")
-            l.remove("")
-        except ValueError:
-            pass
-        return self._getitem_from_list(l)
-
-    def _getitem_from_list(self, x):
-        if len(x) == 0:
+        keys = [k for k in x.split("/") if k]
+        if len(keys) == 0:
             raise Exception("invalid slice value to tree")
 
-        k = x.pop(0)
-        er = f"{k} not found in tree - check keys"
-        assert k in self._tree.keys(), er
-
-        if len(x) == 0:
-            return self._tree[k]
-        else:
-            tree = self._tree[k].tree
-            return tree._getitem_from_list(x)
+        tree = self
+        for i, k in enumerate(keys):
+            node = tree._tree.get(k)
+            if node is None:
+                raise KeyError(f"{k} not found in tree - check keys")
+            if i < len(keys) - 1:
+                tree = node.tree
+        return node
 
     def __repr__(self):
         space = " " * len(self.__class__.__name__) + "  "
-        string = f"{self.__class__.__name__}( An object tree containing the following top-level object instances:"
-        string += "\n"
-        for k, v in self._tree.items():
-            string += "\n" + space + f"    {k} \t\t ({v.__class__.__name__})"
-        string += "\n)"
-        return string
+        lines = [
+            f"{self.__class__.__name__}( An object tree containing the following top-level object instances:",
+            "",
+        ]
+        lines.extend(
+            f"{space}    {k} \t\t ({v.__class__.__name__})"
+            for k, v in self._tree.items()
+        )
+        lines.append(")")
+        return "\n".join(lines)
 
     def keys(self):
         return self._tree.keys()
@@ -52,28 +49,30 @@ class Tree:
         self._print_tree_to_screen(self)
         print("\n")
 
-    def _print_tree_to_screen(self, tree, tablevel=0, linelevels=[]):
-        """ """
-        if tablevel not in linelevels:
-            linelevels.append(tablevel)
-        keys = [k for k in tree.keys()]
-        # keys = [k for k in keys if k != 'metadata']
-        N = len(keys)
-        for i, k in enumerate(keys):
-            string = ""
-            string += "|" if 0 in linelevels else ""
-            for idx in range(tablevel):
-                l = "|" if idx + 1 in linelevels else ""
-                string += "\t" + l
-            # print(string)
-            print(string + "--" + k)
-            if i == N - 1:
-                linelevels.remove(tablevel)
-            try:
-                self._print_tree_to_screen(
-                    tree[k].tree, tablevel=tablevel + 1, linelevels=linelevels
-                )
-            except AttributeError:
-                pass
+    def _print_tree_to_screen(self, tree):
+        """
+        Prints the tree structure, walking it depth-first with an explicit
+        stack. Each stack entry carries the string of vertical bars drawn
+        for its ancestors, so each line is built with a single concatenation.
+        """
+        lines = []
+        stack = []
+        self._push_children(stack, tree, 0, "")
+        while stack:
+            k, node, depth, is_last, prefix = stack.pop()
+            lines.append(("|" if depth == 0 else prefix + "\t|") + "--" + k)
+            subtree = getattr(node, "tree", None)
+            if subtree is not None:
+                bar = "" if is_last else "|"
+                prefix = bar if depth == 0 else prefix + "\t" + bar
+                self._push_children(stack, subtree, depth + 1, prefix)
+        if lines:
+            print("\n".join(lines))
 
-        pass
+    @staticmethod
+    def _push_children(stack, tree, depth, prefix):
+        items = list(tree._tree.items())
+        N = len(items)
+        for i in range(N - 1, -1, -1):
+            k, node = items[i]
+            stack.append((k, node, depth, i == N - 1, prefix))
@@ -34,7 +34,7 @@ class BraggVectors:
         self.tree = Tree()
         if not hasattr(self, "_metadata"):
             self._metadata = {}
-        if "braggvectors" not in self._metadata.keys():
+        if "braggvectors" not in self._metadata:
             self.metadata = Metadata(name="braggvectors")
         self.metadata["braggvectors"]["Qshape"] = self.Qshape
 
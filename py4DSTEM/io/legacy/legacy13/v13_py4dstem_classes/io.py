@@ -2,7 +2,6 @@
 
 import numpy as np
 import h5py
-from os.path import basename
 
 from py4DSTEM.io.legacy.legacy13.v13_emd_classes.io import (
     Array_from_h5,
@@ -447,7 +446,7 @@ def BraggVectors_from_h5(group: h5py.Group):
     )
 
     er = f"Group {group} is not a valid BraggVectors group"
-    assert "emd_group_type" in group.attrs.keys(), er
+    assert "emd_group_type" in group.attrs, er
     assert group.attrs["emd_group_type"] == 4, er
 
     # Get uncalibrated peak
@@ -461,7 +460,9 @@ def BraggVectors_from_h5(group: h5py.Group):
         raise Exception("could not read Qshape")
 
     # Set up BraggVectors
-    braggvectors = BraggVectors(v_uncal.shape, Qshape=Qshape, name=basename(group.name))
+    braggvectors = BraggVectors(
+        v_uncal.shape, Qshape=Qshape, name=group.name.rpartition("/")[2]
+    )
     braggvectors._v_uncal = v_uncal
 
     # Add calibrated peaks, if they're there
@@ -3,7 +3,7 @@
 import h5py
 import numpy as np
 import warnings
-from os.path import exists, basename, dirname, join
+from os.path import exists, dirname, join
 from typing import Optional, Union
 
 from py4DSTEM.io.legacy.read_utils import is_py4DSTEM_version13
@@ -60,11 +60,11 @@ def read_legacy13(
         filepath
     ), f"Error: {filepath} isn't recognized as a v13 py4DSTEM file."
 
-    if root is None:
-        # check if there is a single object in the file
-        # if so, set root to that file; otherwise raise an Exception or Warning
-
-        with h5py.File(filepath, "r") as f:
+    # Open file
+    with h5py.File(filepath, "r") as f:
+        if root is None:
+            # check if there is a single object in the file
+            # if so, set root to that file; otherwise raise an Exception or Warning
             l1keys = list(f.keys())
             if len(l1keys) == 0:
                 raise Exception("No top level groups found in this HDF5 file!")
@@ -87,8 +87,6 @@ def read_legacy13(
                     # this is a windows fix
                     root = root.replace("\\", "/")
 
-    # Open file
-    with h5py.File(filepath, "r") as f:
         # open the selected group
         try:
             group_data = f[root]
@@ -125,7 +123,7 @@ def _read_without_tree(grp):
     # handle empty datasets
     if grp.attrs["emd_group_type"] == "root":
         data = Root(
-            name=basename(grp.name),
+            name=grp.name.rpartition("/")[2],
         )
         return data
 
@@ -149,30 +147,35 @@ def _read_without_root(grp):
 
 
 def _read_calibration(grp):
-    keys = [k for k in grp.keys() if isinstance(grp[k], h5py.Group)]
-    keys = [k for k in keys if (_get_v13_class(grp[k]) == Calibration)]
-    if len(keys) > 0:
-        k = keys[0]
-        cal = Calibration.from_h5(grp[k])
-        return cal
+    for v in grp.values():
+        if _is_v13_group(v) and _get_v13_class(v) == Calibration:
+            return Calibration.from_h5(v)
+    name = dirname(grp.name)
+    if name != "/":
+        grp_upstream = grp.file[name]
+        return _read_calibration(grp_upstream)
     else:
-        name = dirname(grp.name)
-        if name != "/":
-            grp_upstream = grp.file[dirname(grp.name)]
-            return _read_calibration(grp_upstream)
-        else:
-            return None
+        return None
 
 
 def _populate_tree(tree, grp):
-    keys = [k for k in grp.keys() if isinstance(grp[k], h5py.Group)]
-    keys = [
-        k for k in keys if (k[0] != "_" and not _get_v13_class(grp[k]) == Calibration)
-    ]
-    for key in keys:
-        tree[key] = _read_without_tree(grp[key])
-        _populate_tree(tree[key].tree, grp[key])
-    pass
+    for key in grp:
+        # skip metadata and other private groups without opening them
+        if key[0] == "_":
+            continue
+        subgrp = grp[key]
+        if not _is_v13_group(subgrp) or _get_v13_class(subgrp) == Calibration:
+            continue
+        tree[key] = _read_without_tree(subgrp)
+        _populate_tree(tree[key].tree, subgrp)
+
+
+def _is_v13_group(obj):
+    """
+    Cheap pre-filter: only h5py Groups carrying an `emd_group_type` attribute
+    can hold v13 objects.
+    """
+    return isinstance(obj, h5py.Group) and "emd_group_type" in obj.attrs
 
 
 def print_v13h5_tree(filepath, show_metadata=False):
@@ -215,41 +218,38 @@ def print_v13h5pyFile_tree(f, tablevel=0, linelevels=[], show_metadata=False):
     pass
 
 
+_V13_CLASSES = {
+    "Metadata": Metadata,
+    "Array": Array,
+    "PointList": PointList,
+    "PointListArray": PointListArray,
+    "Calibration": Calibration,
+    "DataCube": DataCube,
+    "DiffractionSlice": DiffractionSlice,
+    "VirtualDiffraction": VirtualDiffraction,
+    "DiffractionImage": VirtualDiffraction,
+    "RealSlice": RealSlice,
+    "VirtualImage": VirtualImage,
+    "Probe": Probe,
+    "QPoints": QPoints,
+    "BraggVectors": BraggVectors,
+}
+
+_V13_EMD_GROUP_TYPES = {
+    "root": "root",
+    0: "Metadata",
+    1: "Array",
+    2: "PointList",
+    3: "PointListArray",
+}
+
+
 def _get_v13_class(grp):
-    lookup = {
-        "Metadata": Metadata,
-        "Array": Array,
-        "PointList": PointList,
-        "PointListArray": PointListArray,
-        "Calibration": Calibration,
-        "DataCube": DataCube,
-        "DiffractionSlice": DiffractionSlice,
-        "VirtualDiffraction": VirtualDiffraction,
-        "DiffractionImage": VirtualDiffraction,
-        "RealSlice": RealSlice,
-        "VirtualImage": VirtualImage,
-        "Probe": Probe,
-        "QPoints": QPoints,
-        "BraggVectors": BraggVectors,
-    }
-
-    if "py4dstem_class" in grp.attrs:
-        classname = grp.attrs["py4dstem_class"]
-    elif "emd_group_type" in grp.attrs:
-        emd_group_type = grp.attrs["emd_group_type"]
-        classname = {
-            "root": "root",
-            0: Metadata,
-            1: Array,
-            2: PointList,
-            3: PointListArray,
-        }[emd_group_type]
-    else:
-        warnings.warn(f"Can't determine class type of H5 group {grp}; skipping...")
-        return None
-    try:
-        __class__ = lookup[classname]
-        return __class__
-    except KeyError:
+    classname = grp.attrs.get("py4dstem_class")
+    if classname is None:
+        emd_group_type = grp.attrs.get("emd_group_type")
+        classname = _V13_EMD_GROUP_TYPES.get(emd_group_type)
+    __class__ = _V13_CLASSES.get(classname)
+    if __class__ is None:
         warnings.warn(f"Can't determine class type of H5 group {grp}; skipping...")
-        return None
+    return __class__
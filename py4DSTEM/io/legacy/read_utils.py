@@ -52,7 +52,7 @@ def get_py4DSTEM_version(filepath, topgroup="4DSTEM_experiment"):
     with h5py.File(filepath, "r") as f:
         version_major = int(f[topgroup].attrs["version_major"])
         version_minor = int(f[topgroup].attrs["version_minor"])
-        if "version_release" in f[topgroup].attrs.keys():
+        if "version_release" in f[topgroup].attrs:
             version_release = int(f[topgroup].attrs["version_release"])
         else:
             version_release = 0
@@ -63,7 +63,7 @@ def get_UUID(filepath, topgroup="4DSTEM_experiment"):
     """Returns the UUID of a py4DSTEM file, or if unavailable returns -1."""
     assert is_py4DSTEM_file(filepath), "Error: not recognized as a py4DSTEM file"
     with h5py.File(filepath, "r") as f:
-        if topgroup in f.keys():
+        if topgroup in f:
             if "UUID" in f[topgroup].attrs:
                 return f[topgroup].attrs["UUID"]
     return -1
@@ -91,7 +91,7 @@ def get_N_dataobjects(filepath, topgroup="4DSTEM_experiment"):
     """
     assert is_py4DSTEM_file(filepath), "Error: not recognized as a py4DSTEM file"
     with h5py.File(filepath, "r") as f:
-        assert topgroup in f.keys(), "Error: unrecognized topgroup"
+        assert topgroup in f, "Error: unrecognized topgroup"
         N_dc = len(f[topgroup]["data/datacubes"].keys())
         N_cdc = len(f[topgroup]["data/counted_datacubes"].keys())
         N_ds = len(f[topgroup]["data/diffractionslices"].keys())
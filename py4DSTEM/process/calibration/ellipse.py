@@ -237,10 +237,13 @@ def double_sided_gaussian(p, x, y):
     r2 = A * (x - x0) ** 2 + B * (x - x0) * (y - y0) + C * (y - y0) ** 2
     r = np.sqrt(r2) - R
 
+    # the inner and outer halves of the Janus gaussian share one exp, with the
+    # width selected per point by which side of R it falls on
+    sigma12 = np.where(r < 0, sigma1, sigma2)
+
     return (
         I0 * np.exp(-r2 / (2 * sigma0**2))
-        + I1 * np.exp(-(r**2) / (2 * sigma1**2)) * np.heaviside(-r, 0.5)
-        + I1 * np.exp(-(r**2) / (2 * sigma2**2)) * np.heaviside(r, 0.5)
+        + I1 * np.exp(-(r**2) / (2 * sigma12**2))
         + c_bkgd
     )
 
@@ -1,20 +1,22 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from copy import copy
 from py4DSTEM.process.utils.elliptical_coords import *  ## What else is used here? These fns have
 
 ## moved around some. In general, specifying
 ## the fns is better practice. TODO: change
 ## this import
 from py4DSTEM.process.calibration import fit_ellipse_amorphous_ring
-import matplotlib
-from tqdm import tqdm
+from scipy.fft import rfft
+from emdfile import tqdmnd
 
-# this fixes figure sizes on HiDPI screens
-matplotlib.rcParams["figure.dpi"] = 200
-plt.ion()
 
+# working set size targeted by each tile of compute_polar_stack_symmetries; small
+# enough that a tile's input and spectra stay resident in a typical L3 cache
+_SYMMETRY_TILE_BYTES = 8 * 2**20
 
-def fit_stack(datacube, init_coefs, mask=None):
+
+def fit_stack(datacube, init_coefs, mask=None, *, center, fitradii):
     """
     This will fit an ellipse using the polar elliptical transform code to all the
     diffraction patterns. It will take in a datacube and return a coefficient array which
@@ -22,25 +24,47 @@ def fit_stack(datacube, init_coefs, mask=None):
 
     Args:
         datacute: a datacube of diffraction data
-        init_coefs: an initial starting guess for the fit
+        init_coefs: an initial starting guess for the fit, passed to
+            fit_ellipse_amorphous_ring as p0. If None, it is guessed for each pattern.
         mask: a mask, either 2D or 4D, for either one mask for the whole stack, or one
-            per pattern.
+            per pattern. If None, no mask is used.
+        center: the center (x0,y0) of the patterns
+        fitradii: the inner and outer radii of the fitting annulus
 
     Returns:
-        an array of coefficients of the fit
+        an array of shape (R_Nx, R_Ny, 11) of the fit coefficients of each pattern, in
+        the order used by calculate_coef_strain. The fitted ellipse
+        Ax^2 + Bxy + Cy^2 = 1 is stored as R = 1/sqrt(A), B/A and C/A, i.e. as
+        x^2 + (B/A)xy + (C/A)y^2 = R^2
     """
-    coefs_array = np.zeros([i for i in datacube.data.shape[0:2]] + [len(init_coefs)])
-    for i in tqdm(range(datacube.R_Nx)):
-        for j in tqdm(range(datacube.R_Ny)):
-            if len(mask.shape) == 2:
-                mask_current = mask
-            elif len(mask.shape) == 4:
-                mask_current = mask[i, j, :, :]
-
-            coefs = fit_ellipse_amorphous_ring(
-                datacube.data[i, j, :, :], init_coefs, mask=mask_current
-            )
-            coefs_array[i, j] = coefs
+    coefs_array = np.zeros([i for i in datacube.data.shape[0:2]] + [11])
+
+    # a 2D mask (or None) is shared by every pattern; only a 4D mask needs indexing
+    per_pattern_mask = mask is not None and mask.ndim == 4
+    mask_current = mask
+
+    for i, j in tqdmnd(
+        datacube.R_Nx,
+        datacube.R_Ny,
+        desc="Fitting ellipses",
+        unit="DP",
+    ):
+        if per_pattern_mask:
+            mask_current = mask[i, j]
+
+        _, p = fit_ellipse_amorphous_ring(
+            datacube.data[i, j, :, :],
+            center,
+            fitradii,
+            p0=init_coefs,
+            mask=mask_current,
+        )
+        # (I0,I1,sigma0,sigma1,sigma2,c_bkgd,x0,y0,A,B,C) -> (...,c_bkgd,R,x0,y0,B,C)
+        A = p[8]
+        coefs_array[i, j, :6] = p[:6]
+        coefs_array[i, j, 6] = 1 / np.sqrt(A)
+        coefs_array[i, j, 7:9] = p[6:8]
+        coefs_array[i, j, 9:] = p[9:] / A
 
     return coefs_array
 
@@ -56,9 +80,9 @@ def calculate_coef_strain(coef_cube, r_ref):
         * sigma1      inner std of Janus gaussian
         * sigma2      outer std of Janus gaussian
         * c_bkgd      a constant offset
-        * R           center of the Janus gaussian
+        * R           radius of the Janus gaussian along x
         * x0,y0       the origin
-        * B,C         1x^2 + Bxy + Cy^2 = 1
+        * B,C         1x^2 + Bxy + Cy^2 = R^2
 
     Args:
         coef_cube: output from fit_stack
@@ -72,33 +96,28 @@ def calculate_coef_strain(coef_cube, r_ref):
             * **exy**: shear
 
     """
-    R = coef_cube[:, :, 6]
-    r_ratio = (
-        R / r_ref
-    )  # this is a correction factor for what defines 0 strain, and must be applied to A, B and C. This has been found _experimentally_! TODO have someone else read this
-
-    A = 1 / r_ratio**2
-    B = coef_cube[:, :, 9] / r_ratio**2
-    C = coef_cube[:, :, 10] / r_ratio**2
-
-    exx, eyy, exy = np.empty_like(A), np.empty_like(C), np.empty_like(B)
-
-    for i in range(A.shape[0]):
-        for j in range(A.shape[1]):
-            m_ellipse = np.asarray([[A[i, j], B[i, j] / 2], [B[i, j] / 2, C[i, j]]])
-            e_vals, e_vecs = np.linalg.eig(m_ellipse)
-            ang = np.arctan2(e_vecs[1, 0], e_vecs[0, 0])
-            rot_matrix = np.asarray(
-                [[np.cos(ang), -np.sin(ang)], [np.sin(ang), np.cos(ang)]]
-            )
-            transformation_matrix = np.diag(np.sqrt(e_vals))
-            transformation_matrix = rot_matrix @ transformation_matrix @ rot_matrix.T
-
-            exx[i, j] = transformation_matrix[0, 0] - 1
-            eyy[i, j] = transformation_matrix[1, 1] - 1
-            exy[i, j] = 0.5 * (
-                transformation_matrix[0, 1] + transformation_matrix[1, 0]
-            )
+    # pull the needed coefficients out into contiguous (R_Nx,R_Ny) planes, so the
+    # elementwise math below runs on unit-stride arrays
+    R = np.ascontiguousarray(coef_cube[:, :, 6])
+    B0 = np.ascontiguousarray(coef_cube[:, :, 9])
+    C0 = np.ascontiguousarray(coef_cube[:, :, 10])
+
+    # r_ratio = R/r_ref corrects for what defines 0 strain (found experimentally). It
+    # divides the ellipse matrix [[1, B0/2], [B0/2, C0]] by r_ratio**2, so it scales
+    # that matrix's square root, the transformation matrix, by 1/|r_ratio|
+    scale = np.abs(r_ref / R)
+
+    # the transformation matrix rot_matrix @ diag(sqrt(e_vals)) @ rot_matrix.T is
+    # the square root of the symmetric positive definite 2x2 matrix
+    # M = [[1, B0/2], [B0/2, C0]], which by Cayley-Hamilton is
+    # (M + sqrt(det M) I) / sqrt(tr M + 2 sqrt(det M)). This is evaluated over the
+    # whole scan at once, with no eigendecomposition
+    sqrt_det = np.sqrt(C0 - (B0 / 2) ** 2)
+    norm = scale / np.sqrt(1 + C0 + 2 * sqrt_det)
+
+    exx = (1 + sqrt_det) * norm - 1
+    eyy = (C0 + sqrt_det) * norm - 1
+    exy = (B0 / 2) * norm
 
     return exx, eyy, exy
 
@@ -112,63 +131,37 @@ def plot_strains(strains, cmap="RdBu_r", vmin=None, vmax=None, mask=None):
         cmap, vmin, vmax: imshow parameters
         mask: real space mask of values not to show (black)
     """
-    cmap = plt.get_cmap(cmap)
+    # work on a copy, so setting the masked colors below doesn't modify the
+    # registered colormap
+    cmap = copy(plt.get_cmap(cmap))
+    strains = np.stack(strains)
     if vmin is None:
-        vmin = np.min(strains)
+        vmin = np.nanmin(strains)
     if vmax is None:
-        vmax = np.max(strains)
-    if mask is None:
-        mask = np.ones_like(strains[0])
-    else:
+        vmax = np.nanmax(strains)
+    if mask is not None:
         cmap.set_under("black")
         cmap.set_over("black")
         cmap.set_bad("black")
 
-    mask = mask.astype(bool)
-
-    for i in strains:
-        i[mask] = np.nan
-
-    plt.figure(88, figsize=(9, 5.8), clear=True)
-    f, (ax1, ax2, ax3) = plt.subplots(1, 3, num=88)
-    ax1.imshow(strains[0], cmap=cmap, vmin=vmin, vmax=vmax)
-    ax1.tick_params(
-        axis="both",
-        which="both",
-        bottom=False,
-        top=False,
-        left=False,
-        right=False,
-        labelbottom=False,
-        labelleft=False,
-    )
-    ax1.set_title(r"$\epsilon_{xx}$")
-
-    ax2.imshow(strains[1], cmap=cmap, vmin=vmin, vmax=vmax)
-    ax2.tick_params(
-        axis="both",
-        which="both",
-        bottom=False,
-        top=False,
-        left=False,
-        right=False,
-        labelbottom=False,
-        labelleft=False,
-    )
-    ax2.set_title(r"$\epsilon_{yy}$")
-
-    im = ax3.imshow(strains[2], cmap=cmap, vmin=vmin, vmax=vmax)
-    ax3.tick_params(
-        axis="both",
-        which="both",
-        bottom=False,
-        top=False,
-        left=False,
-        right=False,
-        labelbottom=False,
-        labelleft=False,
-    )
-    ax3.set_title(r"$\epsilon_{xy}$")
+        # hide masked values without modifying the caller's arrays
+        strains = np.where(mask.astype(bool), np.nan, strains)
+
+    f, axs = plt.subplots(1, 3, num=88, figsize=(9, 5.8), clear=True)
+    titles = (r"$\epsilon_{xx}$", r"$\epsilon_{yy}$", r"$\epsilon_{xy}$")
+    for ax, strain, title in zip(axs, strains, titles):
+        im = ax.imshow(strain, cmap=cmap, vmin=vmin, vmax=vmax)
+        ax.tick_params(
+            axis="both",
+            which="both",
+            bottom=False,
+            top=False,
+            left=False,
+            right=False,
+            labelbottom=False,
+            labelleft=False,
+        )
+        ax.set_title(title)
 
     cbar_ax = f.add_axes([0.125, 0.25, 0.775, 0.05])
     f.colorbar(im, cax=cbar_ax, orientation="horizontal")
@@ -200,12 +193,58 @@ def compute_polar_stack_symmetries(datacube_polar):
     function
 
     Args:
-        datacube_polar: diffraction pattern cube that has been polar transformed
+        datacube_polar: diffraction pattern cube that has been polar transformed; either
+            a PolarDatacube, whose patterns are transformed on access and have their
+            unsampled pixels set to zero, or an object whose .data is an ndarray of
+            shape (R_Nx, R_Ny, Q_Ntheta, Q_Nr)
 
     Returns:
         the normalized fft along the theta direction of the autocorrelated patterns in
-        datacube_polar
+        datacube_polar, of shape (R_Nx, R_Ny, Q_Ntheta//2 + 1, Q_Nr). Index n along
+        the third axis is the n-fold symmetry order. Each radial bin is normalized by
+        its zeroth order term, and radial bins with no intensity (e.g. beyond the
+        detector edge) are set to zero. The computation is done in single precision
+        (float32/complex64), which halves memory traffic at the cost of some precision
+        for very low contrast patterns; the output is float32.
     """
+    data = datacube_polar.data
+    is_array = isinstance(data, np.ndarray)
+    if is_array:
+        R_Nx, R_Ny, Q_Ntheta, Q_Nr = data.shape
+    else:
+        # a PolarDatacube's data getter only supports indexing by scan position
+        R_Nx, R_Ny = datacube_polar.data_raw.Rshape
+        Q_Ntheta, Q_Nr = datacube_polar.polar_shape
+    N = R_Nx * R_Ny
+
+    datacube_symmetries = np.empty(
+        (R_Nx, R_Ny, Q_Ntheta // 2 + 1, Q_Nr), dtype=np.float32
+    )
+    symmetries = datacube_symmetries.reshape(N, Q_Ntheta // 2 + 1, Q_Nr)
+
+    # stream the probe positions through in tiles, so each tile's input, spectrum
+    # and power spectrum stay in cache; ~16 bytes per input pixel are live at once
+    tile = max(1, _SYMMETRY_TILE_BYTES // (16 * Q_Ntheta * Q_Nr))
+    for k in range(0, N, tile):
+        # index the 4D data by the tile's probe positions, so only the tile is
+        # gathered, whatever the memory layout of the full cube
+        rx, ry = np.unravel_index(np.arange(k, min(k + tile, N)), (R_Nx, R_Ny))
+        if is_array:
+            block = data[rx, ry]
+        else:
+            block = np.stack([np.ma.filled(data[i, j], 0) for i, j in zip(rx, ry)])
+
+        # by Wiener-Khinchin, the fft of the autocorrelation along theta is the
+        # power spectrum |fft(data)|^2, so only one forward transform is needed;
+        # the data is real, so only the non-negative orders are computed.
+        # Transforms are threaded over probe positions
+        fft_theta = rfft(block.astype(np.float32, copy=False), axis=1, workers=-1)
+        power = fft_theta.real**2 + fft_theta.imag**2
+
+        # normalize each radial bin by its zeroth order term, leaving empty bins at 0
+        symmetries[k : k + tile] = np.divide(
+            power, power[:, :1], out=np.zeros_like(power), where=power[:, :1] > 0
+        )
 
     return datacube_symmetries
 
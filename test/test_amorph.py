@@ -0,0 +1,118 @@
+import py4DSTEM
+import numpy as np
+from types import SimpleNamespace
+
+from py4DSTEM.process.calibration import double_sided_gaussian
+from py4DSTEM.process.rdf.amorph import (
+    calculate_coef_strain,
+    compute_polar_stack_symmetries,
+    fit_stack,
+)
+
+
+def _strain_reference(coef_cube, r_ref):
+    """per-pixel eigendecomposition of the r_ratio-corrected ellipse matrix"""
+    r_ratio = coef_cube[:, :, 6] / r_ref
+    A = 1 / r_ratio**2
+    B = coef_cube[:, :, 9] / r_ratio**2
+    C = coef_cube[:, :, 10] / r_ratio**2
+
+    exx, eyy, exy = np.empty_like(A), np.empty_like(A), np.empty_like(A)
+    for i in range(A.shape[0]):
+        for j in range(A.shape[1]):
+            m_ellipse = np.asarray([[A[i, j], B[i, j] / 2], [B[i, j] / 2, C[i, j]]])
+            e_vals, e_vecs = np.linalg.eig(m_ellipse)
+            ang = np.arctan2(e_vecs[1, 0], e_vecs[0, 0])
+            rot_matrix = np.asarray(
+                [[np.cos(ang), -np.sin(ang)], [np.sin(ang), np.cos(ang)]]
+            )
+            transformation_matrix = np.diag(np.sqrt(e_vals))
+            transformation_matrix = rot_matrix @ transformation_matrix @ rot_matrix.T
+
+            exx[i, j] = transformation_matrix[0, 0] - 1
+            eyy[i, j] = transformation_matrix[1, 1] - 1
+            exy[i, j] = 0.5 * (
+                transformation_matrix[0, 1] + transformation_matrix[1, 0]
+            )
+    return exx, eyy, exy
+
+
+def _symmetries_reference(data):
+    """fft of the theta autocorrelation, normalized by the zeroth order term"""
+    fft_theta = np.fft.fft(data, axis=2)
+    autocorr = np.fft.ifft(np.abs(fft_theta) ** 2, axis=2)
+    symmetries = np.abs(np.fft.fft(autocorr, axis=2))
+    return symmetries / symmetries[:, :, 0:1]
+
+
+def test_compute_polar_stack_symmetries():
+    """tests compute_polar_stack_symmetries against the autocorrelation route"""
+    Q_Ntheta, Q_Nr = 36, 8
+    data = np.random.default_rng(0).random((2, 3, Q_Ntheta, Q_Nr))
+
+    symmetries = compute_polar_stack_symmetries(SimpleNamespace(data=data))
+
+    assert symmetries.shape == (2, 3, Q_Ntheta // 2 + 1, Q_Nr)
+    assert symmetries.dtype == np.float32
+    reference = _symmetries_reference(data)[:, :, : Q_Ntheta // 2 + 1]
+    assert np.allclose(symmetries, reference, rtol=1e-4, atol=1e-6)
+
+
+def test_compute_polar_stack_symmetries_empty_radii():
+    """tests that radial bins with no intensity give zeros rather than nan"""
+    data = np.random.default_rng(1).random((2, 3, 36, 8))
+    data[:, :, :, -2:] = 0
+
+    symmetries = compute_polar_stack_symmetries(SimpleNamespace(data=data))
+
+    assert np.all(np.isfinite(symmetries))
+    assert np.all(symmetries[:, :, :, -2:] == 0)
+
+
+def test_calculate_coef_strain():
+    """tests calculate_coef_strain against a per-pixel eigendecomposition"""
+    rng = np.random.default_rng(2)
+    coef_cube = rng.random((4, 5, 11))
+    coef_cube[:, :, 6] = rng.uniform(8, 12, (4, 5))
+    coef_cube[:, :, 9] = rng.uniform(-0.2, 0.2, (4, 5))
+    coef_cube[:, :, 10] = rng.uniform(0.8, 1.2, (4, 5))
+    # negative fitted radius
+    coef_cube[0, 0, 6] = -9.5
+    # circular ring, where the eigenvectors are degenerate
+    coef_cube[1, 2, 9] = 0
+    coef_cube[1, 2, 10] = 1
+
+    strains = calculate_coef_strain(coef_cube, r_ref=10)
+
+    for strain, reference in zip(strains, _strain_reference(coef_cube, 10)):
+        assert np.allclose(strain, reference)
+
+
+def test_fit_stack_strain():
+    """tests that fit_stack output gives the known strain of synthetic elliptical rings"""
+    N, r_ref = 64, 15
+    strains = np.array(
+        [
+            [(0.02, -0.01, 0.015), (0, 0, 0)],
+            [(-0.03, 0.01, 0), (0.01, 0.02, -0.02)],
+        ]
+    )
+
+    # a ring at x^T M x = 1, where sqrt(M) * r_ref = I + [[exx, exy], [exy, eyy]]
+    yy, xx = np.meshgrid(np.arange(N), np.arange(N))
+    data = np.empty((2, 2, N, N))
+    for i in range(2):
+        for j in range(2):
+            exx, eyy, exy = strains[i, j]
+            T = np.array([[1 + exx, exy], [exy, 1 + eyy]])
+            M = T @ T / r_ref**2
+            p = (5, 10, 4, 2, 3, 1, 32, 32, M[0, 0], 2 * M[0, 1], M[1, 1])
+            data[i, j] = double_sided_gaussian(p, xx, yy)
+    datacube = py4DSTEM.DataCube(data=data)
+
+    coef_cube = fit_stack(datacube, None, center=(32, 32), fitradii=(6, 28))
+    exx, eyy, exy = calculate_coef_strain(coef_cube, r_ref)
+
+    assert np.allclose(exx, strains[..., 0], atol=1e-4)
+    assert np.allclose(eyy, strains[..., 1], atol=1e-4)
+    assert np.allclose(exy, strains[..., 2], atol=1e-4)